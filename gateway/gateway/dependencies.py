@@ -0,0 +1,33 @@
+from cachetools import TTLCache
+from nameko import config
+from nameko.extensions import DependencyProvider
+
+
+PRODUCT_CACHE_SIZE_KEY = 'PRODUCT_CACHE_SIZE'
+PRODUCT_CACHE_TTL_KEY = 'PRODUCT_CACHE_TTL'
+
+
+class ProductCache(DependencyProvider):
+    """
+    In-process cache of serialized products and their ETags, keyed by
+    product id.
+
+    The cache lives on the dependency provider, so it is shared by all
+    workers of the service container. Entries expire after
+    ``PRODUCT_CACHE_TTL`` seconds, which bounds how stale a product can be
+    when it was changed through another gateway instance.
+
+    Entries are not invalidated when orders are placed: the products service
+    decrements stock asynchronously, so a cached product's ``in_stock`` may
+    be up to ``PRODUCT_CACHE_TTL`` seconds stale after an order.
+
+    """
+
+    def setup(self):
+        self.cache = TTLCache(
+            maxsize=config.get(PRODUCT_CACHE_SIZE_KEY, 10000),
+            ttl=config.get(PRODUCT_CACHE_TTL_KEY, 30),
+        )
+
+    def get_dependency(self, worker_ctx):
+        return self.cache
@@ -1,5 +1,4 @@
-import json
-
+import orjson
 from marshmallow import ValidationError
 from nameko.exceptions import safe_for_serialization, BadRequest
 from nameko.web.handlers import HttpRequestHandler
@@ -8,6 +7,17 @@ from werkzeug import Response
 from gateway.exceptions import ProductNotFound, OrderNotFound
 
 
+# Passed as `content_type` rather than `mimetype`, so werkzeug sets the
+# header as is instead of normalizing the mimetype on every response.
+JSON_CONTENT_TYPE = 'application/json'
+
+
+def json_response(data, status=200):
+    """Builds a json response from an already encoded `data` body.
+    """
+    return Response(data, status=status, content_type=JSON_CONTENT_TYPE)
+
+
 class HttpEntrypoint(HttpRequestHandler):
     """ Overrides `response_from_exception` so we can customize error handling.
     """
@@ -29,13 +39,12 @@ class HttpEntrypoint(HttpRequestHandler):
                 status_code = 400
                 error_code = 'BAD_REQUEST'
 
-        return Response(
-            json.dumps({
+        return json_response(
+            orjson.dumps({
                 'error': error_code,
                 'message': safe_for_serialization(exc),
             }),
-            status=status_code,
-            mimetype='application/json'
+            status=status_code
         )
 
 
@@ -1,4 +1,4 @@
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, post_load
 
 
 class CreateOrderDetailSchema(Schema):
@@ -6,6 +6,13 @@ class CreateOrderDetailSchema(Schema):
     price = fields.Decimal(as_string=True, required=True)
     quantity = fields.Int(required=True)
 
+    @post_load
+    def serialize_price(self, data):
+        # The loaded price is forwarded over RPC, so hand it on in the same
+        # fixed-point string form `as_string=True` dumps it in.
+        data['price'] = format(data['price'], 'f')
+        return data
+
 
 class CreateOrderSchema(Schema):
     order_details = fields.Nested(
@@ -33,3 +40,15 @@ class GetOrderSchema(Schema):
 
     id = fields.Int()
     order_details = fields.Nested(OrderDetail, many=True)
+
+
+# Schemas are stateless with respect to the data they process, so a single
+# instance of each is built at import time and shared by every request.
+PRODUCT = ProductSchema(strict=True)
+PRODUCTS = ProductSchema(many=True, strict=True)
+CREATE_ORDER = CreateOrderSchema(strict=True)
+GET_ORDER = GetOrderSchema()
+
+# Fields exposed for a product; products are already serialized by the
+# products service, so these are copied over without a schema dump.
+PRODUCT_FIELDS = tuple(PRODUCT.fields)
@@ -1,14 +1,35 @@
-import json
+from functools import lru_cache
 
+import orjson
 from marshmallow import ValidationError
 from nameko import config
 from nameko.exceptions import BadRequest
 from nameko.rpc import RpcProxy
-from werkzeug import Response
+from werkzeug.http import generate_etag
 
-from gateway.entrypoints import http
+from gateway.dependencies import ProductCache
+from gateway.entrypoints import http, json_response
 from gateway.exceptions import OrderNotFound, ProductNotFound
-from gateway.schemas import CreateOrderSchema, GetOrderSchema, ProductSchema
+from gateway.schemas import (
+    CREATE_ORDER, GET_ORDER, PRODUCT, PRODUCT_FIELDS, PRODUCTS
+)
+
+
+@lru_cache(maxsize=4096)
+def _image_url(image_root, product_id):
+    """Builds the image url of a product; memoized as the same products
+    appear across many orders.
+    """
+    return '{}/{}.jpg'.format(image_root, product_id)
+
+
+def _parse_body(request):
+    """Parses the json body of `request` straight from its raw bytes.
+    """
+    try:
+        return orjson.loads(request.get_data())
+    except orjson.JSONDecodeError as exc:
+        raise BadRequest("Invalid json: {}".format(exc))
 
 
 class GatewayService(object):
@@ -21,18 +42,32 @@ class GatewayService(object):
     orders_rpc = RpcProxy('orders')
     products_rpc = RpcProxy('products')
 
+    product_cache = ProductCache()
+
     @http(
         "GET", "/products/<string:product_id>",
         expected_exceptions=ProductNotFound
     )
     def get_product(self, request, product_id):
         """Gets product by `product_id`
+
+        Serialized products are cached for a short while, and the response
+        carries an `ETag` so clients can revalidate with `If-None-Match`.
         """
-        product = self.products_rpc.get(product_id)
-        return Response(
-            ProductSchema().dumps(product).data,
-            mimetype='application/json'
-        )
+        cached = self.product_cache.get(product_id)
+        if cached is None:
+            product = self.products_rpc.get(product_id)
+            data = orjson.dumps(
+                {field: product[field] for field in PRODUCT_FIELDS}
+            )
+            cached = self.product_cache[product_id] = (
+                data, generate_etag(data)
+            )
+        data, etag = cached
+
+        response = json_response(data)
+        response.set_etag(etag)
+        return response.make_conditional(request)
 
     @http(
         "POST", "/products",
@@ -58,21 +93,73 @@ class GatewayService(object):
 
         """
 
-        schema = ProductSchema(strict=True)
-
-        try:
-            # load input data through a schema (for validation)
-            # Note - this may raise `ValueError` for invalid json,
-            # or `ValidationError` if data is invalid.
-            product_data = schema.loads(request.get_data(as_text=True)).data
-        except ValueError as exc:
-            raise BadRequest("Invalid json: {}".format(exc))
+        # load input data through a schema (for validation)
+        # Note - this may raise `BadRequest` for invalid json,
+        # or `ValidationError` if data is invalid.
+        product_data = PRODUCT.load(_parse_body(request)).data
 
         # Create the product
         self.products_rpc.create(product_data)
-        return Response(
-            json.dumps({'id': product_data['id']}), mimetype='application/json'
-        )
+        self.product_cache.pop(product_data['id'], None)
+        return json_response(orjson.dumps({'id': product_data['id']}))
+
+    @http(
+        "POST", "/products/batch",
+        expected_exceptions=(ValidationError, BadRequest)
+    )
+    def create_products(self, request):
+        """Create several products at once - a list of products is posted
+        as json
+
+        Example request ::
+
+            [
+                {
+                    "id": "the_odyssey",
+                    "title": "The Odyssey",
+                    "passenger_capacity": 101,
+                    "maximum_speed": 5,
+                    "in_stock": 10
+                },
+                {
+                    "id": "the_enigma",
+                    "title": "The Enigma",
+                    "passenger_capacity": 4,
+                    "maximum_speed": 200,
+                    "in_stock": 1
+                }
+            ]
+
+
+        The response contains the new product IDs in a json document ::
+
+            [{"id": "the_odyssey"}, {"id": "the_enigma"}]
+
+        """
+
+        # marshmallow 2 loads `null` (and `null` items) without errors, so
+        # the shape of the body is checked before loading it
+        body = _parse_body(request)
+        if not isinstance(body, list) or not all(
+            isinstance(item, dict) for item in body
+        ):
+            raise BadRequest("Expected a list of products")
+
+        # load input data through a schema (for validation)
+        # Note - this may raise `BadRequest` for invalid json,
+        # or `ValidationError` if any of the products is invalid.
+        products_data = PRODUCTS.load(body).data
+        if not products_data:
+            return json_response(orjson.dumps([]))
+
+        # Create all of the products with a single call
+        self.products_rpc.create_many(products_data)
+        for product_data in products_data:
+            self.product_cache.pop(product_data['id'], None)
+
+        return json_response(orjson.dumps([
+            {'id': product_data['id']} for product_data in products_data
+        ]))
 
     @http("GET", "/orders/<int:order_id>", expected_exceptions=OrderNotFound)
     def get_order(self, request, order_id):
@@ -82,10 +169,7 @@ class GatewayService(object):
         products-service.
         """
         order = self._get_order(order_id)
-        return Response(
-            GetOrderSchema().dumps(order).data,
-            mimetype='application/json'
-        )
+        return json_response(orjson.dumps(GET_ORDER.dump(order).data))
 
     def _get_order(self, order_id):
         # Retrieve order data from the orders service.
@@ -93,8 +177,14 @@ class GatewayService(object):
         # raise``OrderNotFound``
         order = self.orders_rpc.get_order(order_id)
 
-        # Retrieve all products from the products service
-        product_map = {prod['id']: prod for prod in self.products_rpc.list()}
+        # Retrieve the ordered products from the products service in a
+        # single batch call.
+        product_ids = sorted(
+            {item['product_id'] for item in order['order_details']}
+        )
+        product_map = {
+            prod['id']: prod for prod in self.products_rpc.list(product_ids)
+        }
 
         # get the configured image root
         image_root = config['PRODUCT_IMAGE_ROOT']
@@ -105,7 +195,7 @@ class GatewayService(object):
 
             item['product'] = product_map[product_id]
             # Construct an image url.
-            item['image'] = '{}/{}.jpg'.format(image_root, product_id)
+            item['image'] = _image_url(image_root, product_id)
 
         return order
 
@@ -140,35 +230,36 @@ class GatewayService(object):
 
         """
 
-        schema = CreateOrderSchema(strict=True)
-
-        try:
-            # load input data through a schema (for validation)
-            # Note - this may raise `ValueError` for invalid json,
-            # or `ValidationError` if data is invalid.
-            order_data = schema.loads(request.get_data(as_text=True)).data
-        except ValueError as exc:
-            raise BadRequest("Invalid json: {}".format(exc))
+        # load input data through a schema (for validation)
+        # Note - this may raise `BadRequest` for invalid json,
+        # or `ValidationError` if data is invalid.
+        order_data = CREATE_ORDER.load(_parse_body(request)).data
 
         # Create the order
         # Note - this may raise `ProductNotFound`
         id_ = self._create_order(order_data)
-        return Response(json.dumps({'id': id_}), mimetype='application/json')
+        return json_response(orjson.dumps({'id': id_}))
 
     def _create_order(self, order_data):
-        # check order product ids are valid
-        valid_product_ids = {prod['id'] for prod in self.products_rpc.list()}
-        for item in order_data['order_details']:
-            if item['product_id'] not in valid_product_ids:
-                raise ProductNotFound(
-                    "Product Id {}".format(item['product_id'])
-                )
+        # check order product ids are valid, looking each distinct id up
+        # once and reporting all of the unknown ones together
+        product_ids = sorted(
+            {item['product_id'] for item in order_data['order_details']}
+        )
+        valid_product_ids = {
+            prod['id'] for prod in self.products_rpc.list(product_ids)
+        }
+        missing_product_ids = [
+            product_id for product_id in product_ids
+            if product_id not in valid_product_ids
+        ]
+        if missing_product_ids:
+            raise ProductNotFound(
+                "Product Id {}".format(", ".join(missing_product_ids))
+            )
 
         # Call orders-service to create the order.
-        # Dump the data through the schema to ensure the values are serialized
-        # correctly.
-        serialized_data = CreateOrderSchema().dump(order_data).data
-        result = self.orders_rpc.create_order(
-            serialized_data['order_details']
-        )
+        # Note - `CreateOrderSchema` already loads prices in their serialized
+        # form, so the data can be passed on as is.
+        result = self.orders_rpc.create_order(order_data['order_details'])
         return result['id']
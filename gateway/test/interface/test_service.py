@@ -1,5 +1,6 @@
 import json
 
+import pytest
 from mock import call
 
 from gateway.exceptions import OrderNotFound, ProductNotFound
@@ -27,6 +28,66 @@ class TestGetProduct(object):
             "title": "The Odyssey"
         }
 
+    def test_product_is_cached(self, gateway_service, web_session):
+        gateway_service.products_rpc.get.return_value = {
+            "in_stock": 10,
+            "maximum_speed": 5,
+            "id": "the_odyssey",
+            "passenger_capacity": 101,
+            "title": "The Odyssey"
+        }
+        first_response = web_session.get('/products/the_odyssey')
+        second_response = web_session.get('/products/the_odyssey')
+        assert first_response.status_code == 200
+        assert second_response.status_code == 200
+        assert first_response.json() == second_response.json()
+        assert gateway_service.products_rpc.get.call_args_list == [
+            call("the_odyssey")
+        ]
+
+    def test_product_not_modified(self, gateway_service, web_session):
+        gateway_service.products_rpc.get.return_value = {
+            "in_stock": 10,
+            "maximum_speed": 5,
+            "id": "the_odyssey",
+            "passenger_capacity": 101,
+            "title": "The Odyssey"
+        }
+        response = web_session.get('/products/the_odyssey')
+        etag = response.headers['ETag']
+
+        response = web_session.get(
+            '/products/the_odyssey', headers={'If-None-Match': etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b''
+
+    def test_create_product_invalidates_cache(
+        self, gateway_service, web_session
+    ):
+        gateway_service.products_rpc.get.return_value = {
+            "in_stock": 10,
+            "maximum_speed": 5,
+            "id": "the_odyssey",
+            "passenger_capacity": 101,
+            "title": "The Odyssey"
+        }
+        web_session.get('/products/the_odyssey')
+        web_session.post(
+            '/products',
+            json.dumps({
+                "in_stock": 20,
+                "maximum_speed": 5,
+                "id": "the_odyssey",
+                "passenger_capacity": 101,
+                "title": "The Odyssey"
+            })
+        )
+        web_session.get('/products/the_odyssey')
+        assert gateway_service.products_rpc.get.call_args_list == [
+            call("the_odyssey"), call("the_odyssey")
+        ]
+
     def test_product_not_found(self, gateway_service, web_session):
         gateway_service.products_rpc.get.side_effect = (
             ProductNotFound('missing'))
@@ -81,6 +142,83 @@ class TestCreateProduct(object):
         assert response.json()['error'] == 'VALIDATION_ERROR'
 
 
+class TestCreateProducts(object):
+    def test_can_create_products(self, gateway_service, web_session):
+        products = [
+            {
+                "in_stock": 10,
+                "maximum_speed": 5,
+                "id": "the_odyssey",
+                "passenger_capacity": 101,
+                "title": "The Odyssey"
+            },
+            {
+                "in_stock": 1,
+                "maximum_speed": 200,
+                "id": "the_enigma",
+                "passenger_capacity": 4,
+                "title": "The Enigma"
+            },
+        ]
+        response = web_session.post('/products/batch', json.dumps(products))
+        assert response.status_code == 200
+        assert response.json() == [{'id': 'the_odyssey'}, {'id': 'the_enigma'}]
+        assert gateway_service.products_rpc.create_many.call_args_list == [
+            call(products)
+        ]
+
+    def test_create_products_fails_with_invalid_json(
+        self, gateway_service, web_session
+    ):
+        response = web_session.post(
+            '/products/batch', 'NOT-JSON'
+        )
+        assert response.status_code == 400
+        assert response.json()['error'] == 'BAD_REQUEST'
+
+    def test_create_products_fails_with_invalid_data(
+        self, gateway_service, web_session
+    ):
+        response = web_session.post(
+            '/products/batch',
+            json.dumps([{"id": 1}])
+        )
+        assert response.status_code == 400
+        assert response.json()['error'] == 'VALIDATION_ERROR'
+        assert not gateway_service.products_rpc.create_many.called
+
+    @pytest.mark.parametrize('body', [
+        'null',
+        '{"id": "the_odyssey"}',
+        '[null]',
+        json.dumps([
+            {
+                "in_stock": 10,
+                "maximum_speed": 5,
+                "id": "the_odyssey",
+                "passenger_capacity": 101,
+                "title": "The Odyssey"
+            },
+            None,
+        ]),
+    ])
+    def test_create_products_fails_when_not_a_list(
+        self, gateway_service, web_session, body
+    ):
+        response = web_session.post('/products/batch', body)
+        assert response.status_code == 400
+        assert response.json()['error'] == 'BAD_REQUEST'
+        assert not gateway_service.products_rpc.create_many.called
+
+    def test_create_products_with_empty_list(
+        self, gateway_service, web_session
+    ):
+        response = web_session.post('/products/batch', '[]')
+        assert response.status_code == 200
+        assert response.json() == []
+        assert not gateway_service.products_rpc.create_many.called
+
+
 class TestGetOrder(object):
 
     def test_can_get_order(self, gateway_service, web_session):
@@ -164,7 +302,8 @@ class TestGetOrder(object):
 
         # check dependencies called as expected
         assert [call(1)] == gateway_service.orders_rpc.get_order.call_args_list
-        assert [call()] == gateway_service.products_rpc.list.call_args_list
+        assert [call(['the_enigma', 'the_odyssey'])] == (
+            gateway_service.products_rpc.list.call_args_list)
 
     def test_order_not_found(self, gateway_service, web_session):
         gateway_service.orders_rpc.get_order.side_effect = (
@@ -220,13 +359,59 @@ class TestCreateOrder(object):
         )
         assert response.status_code == 200
         assert response.json() == {'id': 11}
-        assert gateway_service.products_rpc.list.call_args_list == [call()]
+        assert gateway_service.products_rpc.list.call_args_list == [
+            call(['the_odyssey'])
+        ]
         assert gateway_service.orders_rpc.create_order.call_args_list == [
             call([
                 {'product_id': 'the_odyssey', 'quantity': 3, 'price': '41.00'}
             ])
         ]
 
+    @pytest.mark.parametrize('price, expected_price', [
+        ('1e2', '100'),
+        ('0.00000001', '0.00000001'),
+    ])
+    def test_create_order_sends_fixed_point_prices(
+        self, gateway_service, web_session, price, expected_price
+    ):
+        gateway_service.products_rpc.list.return_value = [
+            {
+                'id': 'the_odyssey',
+                'title': 'The Odyssey',
+                'maximum_speed': 3,
+                'in_stock': 899,
+                'passenger_capacity': 100
+            },
+        ]
+        gateway_service.orders_rpc.create_order.return_value = {
+            'id': 11,
+            'order_details': []
+        }
+
+        response = web_session.post(
+            '/orders',
+            json.dumps({
+                'order_details': [
+                    {
+                        'product_id': 'the_odyssey',
+                        'price': price,
+                        'quantity': 1
+                    }
+                ]
+            })
+        )
+        assert response.status_code == 200
+        assert gateway_service.orders_rpc.create_order.call_args_list == [
+            call([
+                {
+                    'product_id': 'the_odyssey',
+                    'quantity': 1,
+                    'price': expected_price
+                }
+            ])
+        ]
+
     def test_create_order_fails_with_invalid_json(
         self, gateway_service, web_session
     ):
@@ -292,3 +477,54 @@ class TestCreateOrder(object):
         assert response.status_code == 404
         assert response.json()['error'] == 'PRODUCT_NOT_FOUND'
         assert response.json()['message'] == 'Product Id unknown'
+
+    def test_create_order_reports_all_unknown_products(
+        self, gateway_service, web_session
+    ):
+        # setup mock products-service response:
+        gateway_service.products_rpc.list.return_value = [
+            {
+                'id': 'the_odyssey',
+                'title': 'The Odyssey',
+                'maximum_speed': 3,
+                'in_stock': 899,
+                'passenger_capacity': 100
+            },
+        ]
+
+        # call the gateway service to create the order
+        response = web_session.post(
+            '/orders',
+            json.dumps({
+                'order_details': [
+                    {
+                        'product_id': 'unknown_2',
+                        'price': '41',
+                        'quantity': 1
+                    },
+                    {
+                        'product_id': 'the_odyssey',
+                        'price': '41',
+                        'quantity': 1
+                    },
+                    {
+                        'product_id': 'unknown_1',
+                        'price': '41',
+                        'quantity': 1
+                    },
+                    {
+                        'product_id': 'unknown_2',
+                        'price': '41',
+                        'quantity': 2
+                    }
+                ]
+            })
+        )
+        assert response.status_code == 404
+        assert response.json()['error'] == 'PRODUCT_NOT_FOUND'
+        assert response.json()['message'] == (
+            'Product Id unknown_1, unknown_2')
+        assert gateway_service.products_rpc.list.call_args_list == [
+            call(['the_odyssey', 'unknown_1', 'unknown_2'])
+        ]
+        assert not gateway_service.orders_rpc.create_order.called
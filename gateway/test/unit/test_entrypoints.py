@@ -2,7 +2,7 @@ import json
 import pytest
 from marshmallow import ValidationError
 
-from gateway.entrypoints import HttpEntrypoint
+from gateway.entrypoints import HttpEntrypoint, json_response
 from gateway.exceptions import ProductNotFound, OrderNotFound
 
 
@@ -36,3 +36,13 @@ class TestHttpEntrypoint(object):
         assert response.status_code == expected_status_code
         assert response_data['error'] == expected_error
         assert response_data['message'] == expected_message
+
+
+class TestJsonResponse(object):
+
+    def test_json_response(self):
+        response = json_response(b'{"id": 1}', status=201)
+
+        assert response.mimetype == 'application/json'
+        assert response.status_code == 201
+        assert response.data == b'{"id": 1}'
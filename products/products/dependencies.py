@@ -43,16 +43,31 @@ class StorageWrapper:
         else:
             return self._from_hash(product)
 
-    def list(self):
-        keys = self.client.keys(self._format_key('*'))
+    def list(self, product_ids=None):
+        if product_ids is None:
+            keys = self.client.keys(self._format_key('*'))
+        else:
+            keys = [self._format_key(product_id) for product_id in product_ids]
+
+        # Fetch all hashes in one round trip, skipping ids that don't exist.
+        pipeline = self.client.pipeline()
         for key in keys:
-            yield self._from_hash(self.client.hgetall(key))
+            pipeline.hgetall(key)
+        for product in pipeline.execute():
+            if product:
+                yield self._from_hash(product)
 
     def create(self, product):
         self.client.hmset(
             self._format_key(product['id']),
             product)
 
+    def create_many(self, products):
+        pipeline = self.client.pipeline()
+        for product in products:
+            pipeline.hmset(self._format_key(product['id']), product)
+        pipeline.execute()
+
     def decrement_stock(self, product_id, amount):
         return self.client.hincrby(
             self._format_key(product_id), 'in_stock', -amount)
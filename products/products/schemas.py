@@ -7,3 +7,8 @@ class Product(Schema):
     passenger_capacity = fields.Int(required=True)
     maximum_speed = fields.Int(required=True)
     in_stock = fields.Int(required=True)
+
+
+# Built once at import time and shared by every worker.
+PRODUCT = Product(strict=True)
+PRODUCTS = Product(many=True, strict=True)
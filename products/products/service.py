@@ -1,5 +1,6 @@
 import logging
 
+from marshmallow import ValidationError
 from nameko.events import event_handler
 from nameko.rpc import rpc
 
@@ -18,18 +19,35 @@ class ProductsService:
     @rpc
     def get(self, product_id):
         product = self.storage.get(product_id)
-        return schemas.Product().dump(product).data
+        return schemas.PRODUCT.dump(product).data
 
     @rpc
-    def list(self):
-        products = self.storage.list()
-        return schemas.Product(many=True).dump(products).data
+    def list(self, product_ids=None):
+        products = self.storage.list(product_ids)
+        return schemas.PRODUCTS.dump(products).data
 
     @rpc
     def create(self, product):
-        product = schemas.Product(strict=True).load(product).data
+        product = schemas.PRODUCT.load(product).data
         self.storage.create(product)
 
+    @rpc
+    def create_many(self, products):
+        # marshmallow 2 loads `None` (and `None` items) without errors, so
+        # the shape of the input is checked before loading it
+        if not isinstance(products, list):
+            raise ValidationError({'_schema': ['Invalid input type.']})
+        errors = {
+            index: {'_schema': ['Invalid input type.']}
+            for index, product in enumerate(products)
+            if not isinstance(product, dict)
+        }
+        if errors:
+            raise ValidationError(errors)
+
+        products = schemas.PRODUCTS.load(products).data
+        self.storage.create_many(products)
+
     @event_handler('orders', 'order_created')
     def handle_order_created(self, payload):
         for product in payload['order']['order_details']:
@@ -34,6 +34,11 @@ def test_list(storage, products):
         products == sorted(list(listed_products), key=lambda x: x['id']))
 
 
+def test_list_by_ids(storage, products):
+    listed_products = storage.list(['LZ129', 'unknown', 'LZ127'])
+    assert [products[1], products[0]] == list(listed_products)
+
+
 def test_create(product, redis_client, storage):
 
     storage.create(product)
@@ -48,6 +53,18 @@ def test_create(product, redis_client, storage):
     assert product['in_stock'] == int(stored_product[b'in_stock'])
 
 
+def test_create_many(product, redis_client, storage):
+
+    other_product = dict(product, id='LZ129', title='LZ 129')
+
+    storage.create_many([product, other_product])
+
+    assert {b'products:LZ127', b'products:LZ129'} == set(
+        redis_client.keys('products:*'))
+    stored_product = redis_client.hgetall('products:LZ129')
+    assert 'LZ 129' == stored_product[b'title'].decode('utf-8')
+
+
 def test_decrement_stock(storage, create_product, redis_client):
     create_product(id=1, title='LZ 127', in_stock=10)
     create_product(id=2, title='LZ 129', in_stock=11)
@@ -40,6 +40,14 @@ def test_list_products(products, service_container):
     assert products == sorted(listed_products, key=lambda p: p['id'])
 
 
+def test_list_products_by_ids(products, service_container):
+
+    with entrypoint_hook(service_container, 'list') as list_:
+        listed_products = list_(['LZ130', 'LZ127', 'unknown'])
+
+    assert [products[2], products[0]] == listed_products
+
+
 def test_list_productis_when_empty(service_container):
 
     with entrypoint_hook(service_container, 'list') as list_:
@@ -63,6 +71,65 @@ def test_create_product(product, redis_client, service_container):
     assert product['in_stock'] == int(stored_product[b'in_stock'])
 
 
+def test_create_many_products(product, redis_client, service_container):
+
+    other_product = dict(product, id='LZ129', title='LZ 129')
+
+    with entrypoint_hook(service_container, 'create_many') as create_many:
+        create_many([product, other_product])
+
+    assert {b'products:LZ127', b'products:LZ129'} == set(
+        redis_client.keys('products:*'))
+    stored_product = redis_client.hgetall('products:LZ129')
+    assert 'LZ 129' == stored_product[b'title'].decode('utf-8')
+
+
+def test_create_many_products_validation_error(
+    product, redis_client, service_container
+):
+
+    invalid_product = dict(product, id='LZ129', in_stock='not-an-integer')
+
+    with pytest.raises(ValidationError) as exc_info:
+        with entrypoint_hook(service_container, 'create_many') as create_many:
+            create_many([product, invalid_product])
+
+    assert (
+        {1: {'in_stock': ['Not a valid integer.']}} ==
+        exc_info.value.args[0])
+    assert [] == redis_client.keys('products:*')
+
+
+@pytest.mark.parametrize('products, expected_errors', [
+    (None, {'_schema': ['Invalid input type.']}),
+    ([None], {0: {'_schema': ['Invalid input type.']}}),
+])
+def test_create_many_products_validation_error_on_invalid_input(
+    products, expected_errors, redis_client, service_container
+):
+
+    with pytest.raises(ValidationError) as exc_info:
+        with entrypoint_hook(service_container, 'create_many') as create_many:
+            create_many(products)
+
+    assert expected_errors == exc_info.value.args[0]
+    assert [] == redis_client.keys('products:*')
+
+
+def test_create_many_products_validation_error_on_null_item(
+    product, redis_client, service_container
+):
+
+    with pytest.raises(ValidationError) as exc_info:
+        with entrypoint_hook(service_container, 'create_many') as create_many:
+            create_many([product, None])
+
+    assert (
+        {1: {'_schema': ['Invalid input type.']}} ==
+        exc_info.value.args[0])
+    assert [] == redis_client.keys('products:*')
+
+
 @pytest.mark.parametrize('product_overrides, expected_errors', [
     ({'id': 111}, {'id': ['Not a valid string.']}),
     (